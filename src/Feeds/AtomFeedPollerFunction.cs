@@ -1,3 +1,4 @@
+using System.Diagnostics;
 using Microsoft.Azure.Functions.Worker;
 using Microsoft.Extensions.Logging;
 using Nexus.Ingest.Services;
@@ -15,6 +16,9 @@ public sealed class AtomFeedPollerFunction
     private readonly IngestionService _ingestionService;
     private readonly ILogger<AtomFeedPollerFunction> _logger;
 
+    // Upper bound on feeds fetched in parallel per polling cycle
+    private const int MaxConcurrentFeeds = 8;
+
     public AtomFeedPollerFunction(
         FeedManagementService feedManagementService,
         AtomFeedService atomFeedService,
@@ -37,7 +41,7 @@ public sealed class AtomFeedPollerFunction
         var totalFeeds = 0;
         var successfulFeeds = 0;
         var totalNewEntries = 0;
-        var startTime = DateTimeOffset.UtcNow;
+        var startTimestamp = Stopwatch.GetTimestamp();
 
         try
         {
@@ -47,26 +51,33 @@ public sealed class AtomFeedPollerFunction
 
             _logger.LogInformation("Processing {FeedCount} enabled feeds", totalFeeds);
 
-            // Process each feed
-            foreach (var feed in feeds)
+            // Process feeds concurrently; each feed is independent I/O (HTTP fetch + table writes)
+            var options = new ParallelOptions
             {
-                if (ct.IsCancellationRequested)
-                {
-                    _logger.LogWarning("Feed polling cancelled");
-                    break;
-                }
+                MaxDegreeOfParallelism = MaxConcurrentFeeds,
+                CancellationToken = ct
+            };
 
+            await Parallel.ForEachAsync(feeds, options, async (feed, token) =>
+            {
                 try
                 {
-                    var newEntriesCount = await ProcessFeed(feed, ct);
-                    totalNewEntries += newEntriesCount;
-                    successfulFeeds++;
+                    var result = await ProcessFeed(feed, token);
+                    Interlocked.Add(ref totalNewEntries, result.ProcessedCount);
+                    Interlocked.Increment(ref successfulFeeds);
 
-                    // Update success state
+                    // Update success state and latest processed entry in one read/write
                     await _feedManagementService.UpdateFeedStateAsync(
                         feed.Id,
+                        lastEntryId: result.LatestEntryId,
+                        lastEntryPublished: result.LatestEntryPublished,
+                        additionalEntriesProcessed: result.ProcessedCount > 0 ? result.ProcessedCount : null,
                         errorMessage: null, // Clear any previous error
-                        ct: ct);
+                        ct: token);
+                }
+                catch (OperationCanceledException) when (token.IsCancellationRequested)
+                {
+                    throw;
                 }
                 catch (Exception ex)
                 {
@@ -74,20 +85,37 @@ public sealed class AtomFeedPollerFunction
                         "Failed to process feed {FeedId} ({FeedUrl}): {Error}",
                         feed.Id, feed.FeedUrl, ex.Message);
 
-                    // Update error state
-                    await _feedManagementService.UpdateFeedStateAsync(
-                        feed.Id,
-                        errorMessage: ex.Message,
-                        ct: ct);
+                    // Update error state; a failure here must not escape and cancel the other feeds
+                    try
+                    {
+                        await _feedManagementService.UpdateFeedStateAsync(
+                            feed.Id,
+                            errorMessage: ex.Message,
+                            ct: token);
+                    }
+                    catch (OperationCanceledException) when (token.IsCancellationRequested)
+                    {
+                        throw;
+                    }
+                    catch (Exception stateEx)
+                    {
+                        _logger.LogError(stateEx,
+                            "Failed to record error state for feed {FeedId}: {Error}",
+                            feed.Id, stateEx.Message);
+                    }
                 }
-            }
+            });
+        }
+        catch (OperationCanceledException) when (ct.IsCancellationRequested)
+        {
+            _logger.LogWarning("Feed polling cancelled");
         }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Critical error during feed polling cycle: {Error}", ex.Message);
         }
 
-        var duration = DateTimeOffset.UtcNow - startTime;
+        var duration = Stopwatch.GetElapsedTime(startTimestamp);
 
         _logger.LogInformation(
             "Feed polling cycle completed: {SuccessfulFeeds}/{TotalFeeds} feeds processed, " +
@@ -96,9 +124,10 @@ public sealed class AtomFeedPollerFunction
     }
 
     /// <summary>
-    /// Process a single feed and return the number of new entries found.
+    /// Process a single feed and return how many new entries were stored, plus the latest one.
+    /// Feed state is persisted by the caller.
     /// </summary>
-    private async Task<int> ProcessFeed(
+    private async Task<(int ProcessedCount, string? LatestEntryId, DateTimeOffset? LatestEntryPublished)> ProcessFeed(
         Models.FeedConfig feed,
         CancellationToken ct)
     {
@@ -110,90 +139,86 @@ public sealed class AtomFeedPollerFunction
         if (newEntries.Count == 0)
         {
             _logger.LogDebug("No new entries for feed {FeedId}", feed.Id);
-            return 0;
+            return (0, null, null);
         }
 
         _logger.LogInformation(
             "Found {NewEntryCount} new entries for feed {FeedId}",
             newEntries.Count, feed.Id);
 
+        // Process entries in chronological order (oldest first)
+        var orderedEntries = newEntries.OrderBy(e => e.Published).ToList();
+
+        // Create the payloads for ingestion
+        var payloads = orderedEntries
+            .Select(entry => (Payload: new
+            {
+                feedId = feed.Id,
+                feedUrl = feed.FeedUrl,
+                entry = new
+                {
+                    id = entry.Id,
+                    title = entry.Title,
+                    link = entry.Link,
+                    published = entry.Published,
+                    updated = entry.Updated,
+                    content = entry.Content,
+                    summary = entry.Summary,
+                    author = entry.Author,
+                    authorEmail = entry.AuthorEmail,
+                    categories = entry.Categories
+                },
+                metadata = new
+                {
+                    feedType = DetermineFeedType(entry),
+                    processingTimestamp = DateTimeOffset.UtcNow
+                }
+            }, ReceivedAt: entry.Published))
+            .ToList();
+
+        // Store the entries via IngestionService (batched Table transactions)
+        var itemIds = await _ingestionService.StoreItems(
+            payloads,
+            feed.SourceType,
+            feed.AgentName,
+            ct);
+
         var processedCount = 0;
         string? latestEntryId = null;
         DateTimeOffset? latestEntryPublished = null;
 
-        // Process entries in chronological order (oldest first)
-        foreach (var entry in newEntries.OrderBy(e => e.Published))
+        for (var i = 0; i < orderedEntries.Count; i++)
         {
-            try
-            {
-                // Create the payload for ingestion
-                var payload = new
-                {
-                    feedId = feed.Id,
-                    feedUrl = feed.FeedUrl,
-                    entry = new
-                    {
-                        id = entry.Id,
-                        title = entry.Title,
-                        link = entry.Link,
-                        published = entry.Published,
-                        updated = entry.Updated,
-                        content = entry.Content,
-                        summary = entry.Summary,
-                        author = entry.Author,
-                        authorEmail = entry.AuthorEmail,
-                        categories = entry.Categories
-                    },
-                    metadata = new
-                    {
-                        feedType = DetermineFeedType(entry),
-                        processingTimestamp = DateTimeOffset.UtcNow
-                    }
-                };
-
-                // Store the entry via IngestionService
-                var itemId = await _ingestionService.StoreItem(
-                    payload,
-                    feed.SourceType,
-                    feed.AgentName,
-                    entry.Published,
-                    blobs: null, // Feed entries typically don't need blob storage
-                    ct: ct);
-
-                _logger.LogDebug(
-                    "Stored feed entry {EntryId} as item {ItemId} for agent {AgentName}",
-                    entry.Id, itemId, feed.AgentName);
-
-                processedCount++;
-                latestEntryId = entry.Id;
-                latestEntryPublished = entry.Published;
-            }
-            catch (Exception ex)
+            var entry = orderedEntries[i];
+            var itemId = itemIds[i];
+
+            if (itemId == null)
             {
-                _logger.LogError(ex,
-                    "Failed to process entry {EntryId} from feed {FeedId}: {Error}",
-                    entry.Id, feed.Id, ex.Message);
+                _logger.LogError(
+                    "Failed to process entry {EntryId} from feed {FeedId}",
+                    entry.Id, feed.Id);
 
                 // Continue processing other entries even if one fails
+                continue;
             }
+
+            _logger.LogDebug(
+                "Stored feed entry {EntryId} as item {ItemId} for agent {AgentName}",
+                entry.Id, itemId, feed.AgentName);
+
+            processedCount++;
+            latestEntryId = entry.Id;
+            latestEntryPublished = entry.Published;
         }
 
-        // Update feed state with the latest processed entry
         if (processedCount > 0)
         {
-            await _feedManagementService.UpdateFeedStateAsync(
-                feed.Id,
-                lastEntryId: latestEntryId,
-                lastEntryPublished: latestEntryPublished,
-                additionalEntriesProcessed: processedCount,
-                ct: ct);
-
             _logger.LogInformation(
                 "Processed {ProcessedCount} entries for feed {FeedId}, latest: {LatestEntryId}",
                 processedCount, feed.Id, latestEntryId);
         }
 
-        return processedCount;
+        return (processedCount, latestEntryId, latestEntryPublished);
     }
 
     /// <summary>
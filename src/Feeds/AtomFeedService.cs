@@ -1,4 +1,5 @@
 using System.Globalization;
+using System.Net;
 using System.Text.RegularExpressions;
 using System.Xml.Linq;
 using Microsoft.Extensions.Logging;
@@ -10,7 +11,7 @@ namespace Nexus.Ingest.Feeds;
 /// Service for fetching and parsing Atom/RSS feeds.
 /// Handles both Atom 1.0 and RSS 2.0 formats.
 /// </summary>
-public sealed class AtomFeedService
+public sealed partial class AtomFeedService
 {
     private readonly HttpClient _httpClient;
     private readonly ILogger<AtomFeedService> _logger;
@@ -29,15 +30,16 @@ public sealed class AtomFeedService
         "yyyy-MM-ddTHH:mm:ss"
     };
 
+    // Retry policy for transient fetch failures (exponential backoff with full jitter)
+    private const int MaxFetchAttempts = 5;
+    private const int MaxTimeoutAttempts = 2; // each timed-out attempt already costs the 30s client timeout
+    private static readonly TimeSpan RetryBaseDelay = TimeSpan.FromMilliseconds(250);
+    private static readonly TimeSpan RetryMaxDelay = TimeSpan.FromSeconds(30);
+
     public AtomFeedService(HttpClient httpClient, ILogger<AtomFeedService> logger)
     {
         _httpClient = httpClient;
         _logger = logger;
-
-        // Configure HTTP client for feed fetching
-        _httpClient.DefaultRequestHeaders.Add("User-Agent",
-            "Nexus-Feed-Monitor/1.0 (+https://github.com/ComputClaw/nexus)");
-        _httpClient.Timeout = TimeSpan.FromSeconds(30);
     }
 
     /// <summary>
@@ -51,7 +53,7 @@ public sealed class AtomFeedService
         {
             _logger.LogInformation("Fetching feed: {FeedUrl}", feedConfig.FeedUrl);
 
-            var content = await _httpClient.GetStringAsync(feedConfig.FeedUrl, ct);
+            var content = await GetFeedContentWithRetry(feedConfig.FeedUrl, ct);
             var document = XDocument.Parse(content);
 
             var entries = ParseFeed(document, feedConfig.FeedUrl);
@@ -131,6 +133,85 @@ public sealed class AtomFeedService
         }
     }
 
+    /// <summary>
+    /// GET the feed body, retrying connection errors, 408, 429 and 5xx with full-jitter backoff.
+    /// Client timeouts are retried once. A Retry-After longer than the backoff cap ends the
+    /// retries so the next polling cycle picks the feed up instead of hitting a throttling server early.
+    /// Other failures (and the final attempt) surface as HttpRequestException / TaskCanceledException.
+    /// </summary>
+    private async Task<string> GetFeedContentWithRetry(string feedUrl, CancellationToken ct)
+    {
+        var timeouts = 0;
+
+        for (var attempt = 0; ; attempt++)
+        {
+            TimeSpan? retryAfter = null;
+
+            try
+            {
+                using var response = await _httpClient.GetAsync(feedUrl, ct);
+
+                if (response.IsSuccessStatusCode ||
+                    !IsTransientStatus(response.StatusCode) ||
+                    attempt + 1 >= MaxFetchAttempts)
+                {
+                    response.EnsureSuccessStatusCode();
+                    return await response.Content.ReadAsStringAsync(ct);
+                }
+
+                // Honor Retry-After on 429/503 when the server provides it
+                var header = response.Headers.RetryAfter;
+                retryAfter = header?.Delta ?? (header?.Date - DateTimeOffset.UtcNow);
+
+                if (retryAfter > RetryMaxDelay)
+                {
+                    _logger.LogWarning(
+                        "{Status} fetching {FeedUrl} with Retry-After {RetryAfter}, deferring to next poll",
+                        (int)response.StatusCode, feedUrl, retryAfter);
+                    response.EnsureSuccessStatusCode();
+                }
+
+                _logger.LogWarning("Transient {Status} fetching {FeedUrl}, attempt {Attempt}/{MaxAttempts}",
+                    (int)response.StatusCode, feedUrl, attempt + 1, MaxFetchAttempts);
+            }
+            catch (HttpRequestException ex) when (ex.StatusCode == null && attempt + 1 < MaxFetchAttempts)
+            {
+                // No status code means a connection-level failure (DNS, reset, TLS)
+                _logger.LogWarning("Connection error fetching {FeedUrl}, attempt {Attempt}/{MaxAttempts}: {Error}",
+                    feedUrl, attempt + 1, MaxFetchAttempts, ex.Message);
+            }
+            catch (TaskCanceledException) when (!ct.IsCancellationRequested)
+            {
+                // HttpClient.Timeout expired (not caller cancellation)
+                timeouts++;
+                if (timeouts >= MaxTimeoutAttempts || attempt + 1 >= MaxFetchAttempts)
+                    throw;
+
+                _logger.LogWarning("Timeout fetching {FeedUrl}, attempt {Attempt}/{MaxAttempts}",
+                    feedUrl, attempt + 1, MaxFetchAttempts);
+            }
+
+            var delay = retryAfter ?? ComputeBackoff(attempt);
+            if (delay < TimeSpan.Zero) delay = TimeSpan.Zero;
+
+            await Task.Delay(delay, ct);
+        }
+    }
+
+    private static bool IsTransientStatus(HttpStatusCode status)
+    {
+        return status == HttpStatusCode.RequestTimeout ||
+               status == HttpStatusCode.TooManyRequests ||
+               (int)status >= 500;
+    }
+
+    private static TimeSpan ComputeBackoff(int attempt)
+    {
+        // Full jitter: uniform in [0, min(cap, base * 2^attempt)]
+        var ceiling = Math.Min(RetryMaxDelay.TotalMilliseconds, RetryBaseDelay.TotalMilliseconds * Math.Pow(2, attempt));
+        return TimeSpan.FromMilliseconds(Random.Shared.NextDouble() * ceiling);
+    }
+
     private List<AtomEntry> ParseFeed(XDocument document, string feedUrl)
     {
         var feedType = DetectFeedType(document);
@@ -343,7 +424,7 @@ public sealed class AtomFeedService
         }
 
         // Last resort: try to extract ISO date with regex
-        var isoMatch = Regex.Match(dateString, @"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})");
+        var isoMatch = IsoDateRegex().Match(dateString);
         if (isoMatch.Success && DateTime.TryParse(isoMatch.Groups[1].Value, out var dateTime))
         {
             return new DateTimeOffset(dateTime, TimeSpan.Zero);
@@ -351,6 +432,9 @@ public sealed class AtomFeedService
 
         return null;
     }
+
+    [GeneratedRegex(@"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})")]
+    private static partial Regex IsoDateRegex();
 }
 
 /// <summary>
@@ -9,7 +9,7 @@ namespace Nexus.Ingest.Feeds;
 /// Service for managing feed configurations in Azure Table Storage.
 /// Handles CRUD operations and validation for feed subscriptions.
 /// </summary>
-public sealed class FeedManagementService
+public sealed partial class FeedManagementService
 {
     private readonly TableClient _feedConfigsTable;
     private readonly AtomFeedService _atomFeedService;
@@ -325,25 +325,34 @@ public sealed class FeedManagementService
     private static string SanitizeFeedId(string id)
     {
         // Replace invalid characters with hyphens and remove duplicates
-        var sanitized = Regex.Replace(id.ToLowerInvariant(), @"[^a-z0-9\-]", "-");
-        sanitized = Regex.Replace(sanitized, @"-+", "-");
+        var sanitized = InvalidIdCharsRegex().Replace(id.ToLowerInvariant(), "-");
+        sanitized = RepeatedHyphenRegex().Replace(sanitized, "-");
         return sanitized.Trim('-');
     }
 
     private static bool IsValidFeedId(string id)
     {
         return !string.IsNullOrWhiteSpace(id) &&
-               Regex.IsMatch(id, @"^[a-zA-Z0-9\-]+$") &&
+               IdentifierRegex().IsMatch(id) &&
                id.Length <= 100;
     }
 
     private static bool IsValidSourceType(string sourceType)
     {
         return !string.IsNullOrWhiteSpace(sourceType) &&
-               Regex.IsMatch(sourceType, @"^[a-zA-Z0-9\-]+$") &&
+               IdentifierRegex().IsMatch(sourceType) &&
                sourceType.Length <= 50;
     }
 
+    [GeneratedRegex(@"[^a-z0-9\-]")]
+    private static partial Regex InvalidIdCharsRegex();
+
+    [GeneratedRegex(@"-+")]
+    private static partial Regex RepeatedHyphenRegex();
+
+    [GeneratedRegex(@"^[a-zA-Z0-9\-]+$")]
+    private static partial Regex IdentifierRegex();
+
     private static bool IsNotFoundError(Exception ex)
     {
         return ex.Message.Contains("404") || ex.Message.Contains("Not Found");
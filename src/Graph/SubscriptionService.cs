@@ -11,28 +11,46 @@ namespace Nexus.Ingest.Graph;
 /// <summary>
 /// Manages Graph API subscriptions via REST (not SDK — avoids SDK serialization quirks).
 /// Tracks active subscriptions in Azure Table Storage for renewal.
+/// Singleton (keeps one credential and its token cache); HttpClients come from IHttpClientFactory
+/// per call so pooled handlers are still rotated.
 /// </summary>
 public sealed class SubscriptionService
 {
-    private readonly HttpClient _httpClient;
+    public const string HttpClientName = "GraphSubscriptions";
+
+    private readonly IHttpClientFactory _httpClientFactory;
     private readonly ClientSecretCredential _credential;
     private readonly TableClient _subscriptionTable;
-    private readonly IConfiguration _config;
+    private readonly string _publicBaseUrl;
+    private readonly string _functionKeyQuery;
+    private readonly string? _clientState;
     private readonly ILogger<SubscriptionService> _logger;
 
     public SubscriptionService(
+        IHttpClientFactory httpClientFactory,
         TableServiceClient tableService,
         IConfiguration config,
         ILogger<SubscriptionService> logger)
     {
-        _httpClient = new HttpClient { BaseAddress = new Uri("https://graph.microsoft.com/v1.0/") };
+        _httpClientFactory = httpClientFactory;
         _credential = new ClientSecretCredential(
             config["Graph:TenantId"],
             config["Graph:ClientId"],
             config["Graph:ClientSecret"]);
         _subscriptionTable = tableService.GetTableClient("Subscriptions");
-        _config = config;
         _logger = logger;
+
+        // Resolve settings once rather than re-reading configuration on every call
+        _publicBaseUrl = (config["Nexus:PublicBaseUrl"]
+            ?? config["PublicBaseUrl"]
+            ?? "https://nexusrelay.azurewebsites.net").TrimEnd('/');
+
+        var functionKey = config["FunctionKey"];
+        _functionKeyQuery = string.IsNullOrEmpty(functionKey)
+            ? string.Empty
+            : $"?code={Uri.EscapeDataString(functionKey)}";
+
+        _clientState = config["Graph:ClientState"];
     }
 
     private async Task<string> GetTokenAsync(CancellationToken ct)
@@ -44,21 +62,7 @@ public sealed class SubscriptionService
 
     private string BuildUrl(string route)
     {
-        var publicBaseUrl = _config["Nexus:PublicBaseUrl"]
-            ?? _config["PublicBaseUrl"]
-            ?? "https://nexusrelay.azurewebsites.net";
-
-        publicBaseUrl = publicBaseUrl.TrimEnd('/');
-        var baseUrl = $"{publicBaseUrl}/api/{route}";
-
-        var functionKey = _config["FunctionKey"];
-        if (!string.IsNullOrEmpty(functionKey))
-        {
-            var encodedKey = Uri.EscapeDataString(functionKey);
-            return $"{baseUrl}?code={encodedKey}";
-        }
-
-        return baseUrl;
+        return $"{_publicBaseUrl}/api/{route}{_functionKeyQuery}";
     }
 
     public async Task<string> Create(string resource, string changeTypes, string agentName, string webhookType, CancellationToken ct)
@@ -75,7 +79,7 @@ public sealed class SubscriptionService
             ["lifecycleNotificationUrl"] = lifecycleUrl,
             ["resource"] = resource,
             ["expirationDateTime"] = DateTimeOffset.UtcNow.AddDays(6).ToString("o"),
-            ["clientState"] = _config["Graph:ClientState"]
+            ["clientState"] = _clientState
         };
 
         _logger.LogInformation("Creating subscription for {Resource} with URL {NotificationUrl}",
@@ -85,7 +89,7 @@ public sealed class SubscriptionService
         request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", token);
         request.Content = JsonContent.Create(payload);
 
-        var response = await _httpClient.SendAsync(request, ct);
+        var response = await _httpClientFactory.CreateClient(HttpClientName).SendAsync(request, ct);
         var body = await response.Content.ReadAsStringAsync(ct);
 
         if (!response.IsSuccessStatusCode)
@@ -128,7 +132,7 @@ public sealed class SubscriptionService
         request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", token);
         request.Content = JsonContent.Create(new { expirationDateTime = newExpiry.ToString("o") });
 
-        var response = await _httpClient.SendAsync(request, ct);
+        var response = await _httpClientFactory.CreateClient(HttpClientName).SendAsync(request, ct);
         if (!response.IsSuccessStatusCode)
         {
             var body = await response.Content.ReadAsStringAsync(ct);
@@ -162,7 +166,7 @@ public sealed class SubscriptionService
         request.Headers.Authorization = new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", token);
         request.Content = new StringContent("");
 
-        var response = await _httpClient.SendAsync(request, ct);
+        var response = await _httpClientFactory.CreateClient(HttpClientName).SendAsync(request, ct);
         if (!response.IsSuccessStatusCode)
         {
             _logger.LogWarning("Reauthorize failed for {Id}: {Status}", subscriptionId, response.StatusCode);
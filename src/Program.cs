@@ -40,16 +40,24 @@ var host = new HostBuilder()
             services.AddSingleton(new GraphServiceClient(credential));
         }
 
-        // Typed HttpClient for Fireflies (always register so DI resolves; no-op if key not set)
+        // Typed HttpClient for Fireflies (always register so DI resolves; no-op if key not set).
+        // Prefers HTTP/2, negotiating down to HTTP/1.1 via ALPN if the server doesn't offer it.
         var firefliesKey = config["Fireflies:ApiKey"];
         services.AddHttpClient<FirefliesService>(client =>
         {
             client.BaseAddress = new Uri("https://api.fireflies.ai/graphql");
+            client.DefaultRequestVersion = System.Net.HttpVersion.Version20;
+            client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
             if (!string.IsNullOrEmpty(firefliesKey))
             {
                 client.DefaultRequestHeaders.Authorization =
                     new System.Net.Http.Headers.AuthenticationHeaderValue("Bearer", firefliesKey);
             }
+        })
+        .ConfigurePrimaryHttpMessageHandler(() => new HttpClientHandler
+        {
+            // Transcripts are large, highly compressible JSON
+            AutomaticDecompression = System.Net.DecompressionMethods.All
         });
 
         // Application services
@@ -58,11 +66,27 @@ var host = new HostBuilder()
         services.AddSingleton<IngestionService>();
         services.AddSingleton<SubscriptionService>();
 
+        // Named HttpClient for Graph subscription REST calls (SubscriptionService stays a singleton)
+        services.AddHttpClient(SubscriptionService.HttpClientName, client =>
+        {
+            client.BaseAddress = new Uri("https://graph.microsoft.com/v1.0/");
+        });
+
         // Feed management services
         services.AddSingleton<FeedManagementService>();
 
-        // HTTP client for feed fetching
-        services.AddHttpClient<AtomFeedService>();
+        // HTTP client for feed fetching (feeds are XML; accept gzip/deflate/brotli).
+        // User-Agent and timeout live in the client registration, as with Fireflies.
+        services.AddHttpClient<AtomFeedService>(client =>
+            {
+                client.DefaultRequestHeaders.Add("User-Agent",
+                    "Nexus-Feed-Monitor/1.0 (+https://github.com/ComputClaw/nexus)");
+                client.Timeout = TimeSpan.FromSeconds(30);
+            })
+            .ConfigurePrimaryHttpMessageHandler(() => new HttpClientHandler
+            {
+                AutomaticDecompression = System.Net.DecompressionMethods.All
+            });
 
         // Webhook relays
         services.AddSingleton<IWebhookRelay, GraphWebhookRelay>();
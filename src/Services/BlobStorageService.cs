@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Security.Cryptography;
 using System.Text;
 using Azure;
@@ -14,6 +15,9 @@ public sealed class BlobStorageService
     private readonly BlobContainerClient _emailContainer;
     private readonly BlobServiceClient _blobService;
 
+    // Containers already ensured by this instance, so CreateIfNotExists runs once per container
+    private readonly ConcurrentDictionary<string, BlobContainerClient> _ensuredContainers = new();
+
     public BlobStorageService(BlobServiceClient blobService)
     {
         _blobService = blobService;
@@ -40,19 +44,49 @@ public sealed class BlobStorageService
         string extension,
         CancellationToken ct)
     {
-        var container = _blobService.GetBlobContainerClient(containerName);
-        await container.CreateIfNotExistsAsync(cancellationToken: ct);
+        var container = await GetOrCreateContainer(containerName, ct);
+
+        // Encode once; the same UTF-8 bytes feed both the content hash and the upload
+        var bytes = Encoding.UTF8.GetBytes(content);
 
         var date = DateTimeOffset.UtcNow;
-        var contentHash = HashId(content);
+        var contentHash = HashBytes(bytes);
         var blobName = $"{date:yyyy-MM}/{prefix}-{contentHash}.{extension}";
 
         var blob = container.GetBlobClient(blobName);
-        await blob.UploadAsync(BinaryData.FromString(content), overwrite: true, ct);
+        await blob.UploadAsync(BinaryData.FromBytes(bytes), overwrite: true, ct);
 
         return $"{containerName}/{blobName}";
     }
 
+    /// <summary>
+    /// Store an oversized item payload under its ReceivedAt month and content hash,
+    /// so a retried ingestion overwrites the same blob instead of leaving an orphan.
+    /// </summary>
+    public async Task<string> StorePayload(string json, DateTimeOffset receivedAt, CancellationToken ct)
+    {
+        var container = await GetOrCreateContainer("payloads", ct);
+
+        var bytes = Encoding.UTF8.GetBytes(json);
+        var blobName = $"{receivedAt:yyyy-MM}/{HashBytes(bytes)}.json";
+
+        var blob = container.GetBlobClient(blobName);
+        await blob.UploadAsync(BinaryData.FromBytes(bytes), overwrite: true, ct);
+
+        return $"payloads/{blobName}";
+    }
+
+    private async Task<BlobContainerClient> GetOrCreateContainer(string containerName, CancellationToken ct)
+    {
+        if (_ensuredContainers.TryGetValue(containerName, out var cached))
+            return cached;
+
+        var container = _blobService.GetBlobContainerClient(containerName);
+        await container.CreateIfNotExistsAsync(cancellationToken: ct);
+        _ensuredContainers[containerName] = container;
+        return container;
+    }
+
     /// <summary>
     /// Store full email body in blob storage (monthly folders for easy cleanup).
     /// Uses SHA256 hash of message ID to avoid collisions (Graph IDs share common prefix).
@@ -73,9 +107,11 @@ public sealed class BlobStorageService
     /// <summary>
     /// Generate a short, collision-resistant hash from an ID.
     /// </summary>
-    private static string HashId(string id)
+    private static string HashId(string id) => HashBytes(Encoding.UTF8.GetBytes(id));
+
+    private static string HashBytes(byte[] bytes)
     {
-        var hash = SHA256.HashData(Encoding.UTF8.GetBytes(id));
+        var hash = SHA256.HashData(bytes);
         return Convert.ToHexString(hash)[..32].ToLowerInvariant();
     }
 
@@ -15,6 +15,12 @@ public sealed class IngestionService
     private readonly BlobStorageService _blobService;
     private readonly ILogger<IngestionService> _logger;
 
+    // Table transactions allow 100 entities / 4 MB; Payload can be up to 64 KB per entity
+    private const int MaxBatchSize = 25;
+
+    // Table string properties are limited to 64 KB (32K UTF-16 chars); larger payloads go to blob
+    private const int MaxPayloadChars = 32 * 1024;
+
     public IngestionService(
         TableServiceClient tableService,
         BlobStorageService blobService,
@@ -58,10 +64,10 @@ public sealed class IngestionService
         {
             { "AgentName", item.AgentName },
             { "SourceType", item.SourceType },
-            { "Payload", JsonSerializer.Serialize(item.Payload) },
             { "ReceivedAt", item.ReceivedAt },
             { "IngestedAt", DateTimeOffset.UtcNow }
         };
+        await SetPayload(entity, item.Payload, item.ReceivedAt, ct);
 
         foreach (var (key, path) in blobPaths)
         {
@@ -101,10 +107,10 @@ public sealed class IngestionService
             { "AgentName", item.AgentName },
             { "SourceType", item.SourceType },
             { "From", item.SenderEmail },
-            { "Payload", JsonSerializer.Serialize(item.Payload) },
             { "ReceivedAt", item.ReceivedAt },
             { "IngestedAt", DateTimeOffset.UtcNow }
         };
+        await SetPayload(entity, item.Payload, item.ReceivedAt, ct);
 
         foreach (var (key, path) in blobPaths)
             entity[key] = path;
@@ -119,42 +125,108 @@ public sealed class IngestionService
     }
 
     /// <summary>
-    /// Store any webhook payload with unified schema (used by AtomFeedPoller).
+    /// Store several payloads for one source/agent, one Table transaction per batch instead of
+    /// one request per item. Returns item IDs in input order; a failed batch falls back to
+    /// per-item upserts, and items that still fail get null. Only cancellation is thrown, so
+    /// callers can always record progress for the items that were stored.
     /// </summary>
-    public async Task<string> StoreItem<T>(
-        T payload,
+    public async Task<List<string?>> StoreItems<T>(
+        IReadOnlyList<(T Payload, DateTimeOffset ReceivedAt)> items,
         string sourceType,
         string agentName,
-        DateTimeOffset? receivedAt = null,
-        Dictionary<string, string>? blobs = null,
         CancellationToken ct = default)
     {
-        var itemId = $"{sourceType}-{Guid.NewGuid():N}";
-        var received = receivedAt ?? DateTimeOffset.UtcNow;
+        var itemIds = new List<string?>(items.Count);
+
+        foreach (var chunk in items.Chunk(MaxBatchSize))
+        {
+            // Row keys are fixed up front so the per-item fallback overwrites, rather than
+            // duplicates, anything a failed-looking transaction may actually have committed
+            var rowKeys = chunk.Select(_ => $"{sourceType}-{Guid.NewGuid():N}").ToArray();
+
+            try
+            {
+                var actions = new List<TableTransactionAction>(chunk.Length);
+                for (var i = 0; i < chunk.Length; i++)
+                {
+                    var entity = BuildEntity(rowKeys[i], sourceType, agentName, chunk[i].ReceivedAt);
+                    await SetPayload(entity, chunk[i].Payload, chunk[i].ReceivedAt, ct);
+                    actions.Add(new TableTransactionAction(TableTransactionActionType.UpsertReplace, entity));
+                }
+
+                await _itemsTable.SubmitTransactionAsync(actions, ct);
+
+                itemIds.AddRange(rowKeys);
+
+                _logger.LogInformation(
+                    "Stored batch of {Count} {SourceType} items for {Agent}",
+                    chunk.Length, sourceType, agentName);
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
+            {
+                // Transactions are all-or-nothing; retry individually so one bad entity doesn't drop the rest
+                _logger.LogWarning(ex,
+                    "Batch store of {Count} {SourceType} items failed, falling back to per-item: {Error}",
+                    chunk.Length, sourceType, ex.Message);
+
+                for (var i = 0; i < chunk.Length; i++)
+                {
+                    try
+                    {
+                        var entity = BuildEntity(rowKeys[i], sourceType, agentName, chunk[i].ReceivedAt);
+                        await SetPayload(entity, chunk[i].Payload, chunk[i].ReceivedAt, ct);
+                        await _itemsTable.UpsertEntityAsync(entity, TableUpdateMode.Replace, ct);
+                        itemIds.Add(rowKeys[i]);
+                    }
+                    catch (Exception itemEx) when (itemEx is not OperationCanceledException)
+                    {
+                        _logger.LogError(itemEx,
+                            "Failed to store {SourceType} item {ItemId} for {Agent}: {Error}",
+                            sourceType, rowKeys[i], agentName, itemEx.Message);
+                        itemIds.Add(null);
+                    }
+                }
+            }
+        }
+
+        return itemIds;
+    }
 
-        var entity = new TableEntity(sourceType, itemId)
+    private static TableEntity BuildEntity(
+        string itemId,
+        string sourceType,
+        string agentName,
+        DateTimeOffset receivedAt)
+    {
+        return new TableEntity(sourceType, itemId)
         {
             { "AgentName", agentName },
             { "SourceType", sourceType },
-            { "Payload", JsonSerializer.Serialize(payload) },
-            { "ReceivedAt", received },
+            { "ReceivedAt", receivedAt },
             { "IngestedAt", DateTimeOffset.UtcNow }
         };
+    }
 
-        if (blobs?.Count > 0)
+    /// <summary>
+    /// Serialize the payload onto the entity. Payloads too large for a Table property are
+    /// written to blob storage instead and referenced via "PayloadBlob", rather than failing the upsert.
+    /// The blob is named by the item's ReceivedAt month and content hash, so a retry after a
+    /// failed Table write reuses it.
+    /// </summary>
+    private async Task SetPayload<T>(TableEntity entity, T payload, DateTimeOffset receivedAt, CancellationToken ct)
+    {
+        var json = JsonSerializer.Serialize(payload);
+        if (json.Length <= MaxPayloadChars)
         {
-            foreach (var (key, blobPath) in blobs)
-            {
-                entity[key] = blobPath;
-            }
+            entity["Payload"] = json;
+            return;
         }
 
-        await _itemsTable.UpsertEntityAsync(entity, TableUpdateMode.Replace, ct);
+        var path = await _blobService.StorePayload(json, receivedAt, ct);
+        entity["PayloadBlob"] = path;
 
         _logger.LogInformation(
-            "Stored {SourceType} item for {Agent}: {ItemId}",
-            sourceType, agentName, itemId);
-
-        return itemId;
+            "Payload for {ItemId} is {Length} chars, stored in blob {BlobPath}",
+            entity.RowKey, json.Length, path);
     }
 }
@@ -21,8 +21,7 @@ public sealed class FirefliesMeetingProcessor : IWebhookProcessor
 
     public async Task<IngestionItem?> ProcessAsync(WebhookMessage webhook, CancellationToken ct)
     {
-        var payload = JsonSerializer.Deserialize<FirefliesPayload>(
-            webhook.NotificationData.GetRawText());
+        var payload = webhook.NotificationData.Deserialize<FirefliesPayload>();
 
         if (payload == null || string.IsNullOrEmpty(payload.MeetingId))
         {
@@ -1,4 +1,3 @@
-using System.Text.Json;
 using Nexus.Ingest.Models;
 
 namespace Nexus.Ingest.Webhooks.Processors;
@@ -10,8 +9,7 @@ public sealed class GitHubReleaseProcessor : IWebhookProcessor
 
     public Task<IngestionItem?> ProcessAsync(WebhookMessage webhook, CancellationToken ct)
     {
-        var payload = JsonSerializer.Deserialize<JsonElement>(
-            webhook.NotificationData.GetRawText());
+        var payload = webhook.NotificationData;
 
         var releasePayload = new
         {
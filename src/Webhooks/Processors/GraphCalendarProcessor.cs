@@ -21,8 +21,7 @@ public sealed class GraphCalendarProcessor : IWebhookProcessor
 
     public async Task<IngestionItem?> ProcessAsync(WebhookMessage webhook, CancellationToken ct)
     {
-        var notification = JsonSerializer.Deserialize<GraphNotification>(
-            webhook.NotificationData.GetRawText());
+        var notification = webhook.NotificationData.Deserialize<GraphNotification>();
 
         if (notification == null)
         {
@@ -15,8 +15,7 @@ namespace Nexus.Ingest.Webhooks;
 /// </summary>
 public sealed class WebhookRelayFunction
 {
-    private readonly Dictionary<string, IWebhookRelay> _relays;
-    private readonly Dictionary<string, HashSet<string>> _validSourceTypes;
+    private readonly Dictionary<string, (IWebhookRelay Relay, HashSet<string> Types)> _relays;
     private readonly QueueClientFactory _queues;
     private readonly ILogger<WebhookRelayFunction> _logger;
 
@@ -28,14 +27,13 @@ public sealed class WebhookRelayFunction
         _queues = queues;
         _logger = logger;
 
+        // One entry per source: the relay plus its supported types, resolved in a single lookup
         _relays = new(StringComparer.OrdinalIgnoreCase);
-        _validSourceTypes = new(StringComparer.OrdinalIgnoreCase);
 
         foreach (var relay in relays)
         {
-            _relays[relay.Source] = relay;
-            _validSourceTypes[relay.Source] =
-                new HashSet<string>(relay.SupportedTypes, StringComparer.OrdinalIgnoreCase);
+            _relays[relay.Source] =
+                (relay, new HashSet<string>(relay.SupportedTypes, StringComparer.OrdinalIgnoreCase));
         }
     }
 
@@ -50,7 +48,7 @@ public sealed class WebhookRelayFunction
         CancellationToken ct)
     {
         // 1. Validate source/type
-        if (!_validSourceTypes.TryGetValue(source, out var validTypes) || !validTypes.Contains(type))
+        if (!_relays.TryGetValue(source, out var registration) || !registration.Types.Contains(type))
         {
             _logger.LogWarning("Invalid source/type: {Source}/{Type}", source, type);
             var badRequest = req.CreateResponse(HttpStatusCode.BadRequest);
@@ -82,9 +80,8 @@ public sealed class WebhookRelayFunction
         // 4. Delegate to relay
         try
         {
-            var relay = _relays[source];
             var context = new WebhookRelayContext(req, body, agentName, source, type);
-            var messages = await relay.RelayAsync(context, ct);
+            var messages = await registration.Relay.RelayAsync(context, ct);
 
             // null → 401 (auth failure)
             if (messages == null)